@@ -5,11 +5,20 @@ Supports different delivery commands with configurable file paths
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from services.delivery_1_service import Delivery1Service
 
 
+def _stat_or_none(path: Path):
+    """Return the os.stat result of a path, or None if it does not exist"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 def main():
     """Main function with argument parsing"""
     parser = argparse.ArgumentParser(
@@ -80,14 +89,16 @@ Examples:
     stats_path = project_root / args.stats
     sizes_path = project_root / args.sizes
     
-    # Validate files exist
+    # Validate files exist, with a single stat call per file whose result is
+    # handed down to the service and the loaders
+    file_stats = {}
     missing_files = []
-    if not schema_path.exists():
-        missing_files.append(f"Schema file not found: {schema_path}")
-    if not stats_path.exists():
-        missing_files.append(f"Statistics file not found: {stats_path}")
-    if not sizes_path.exists():
-        missing_files.append(f"Key sizes file not found: {sizes_path}")
+    for path, label in ((schema_path, "Schema"), (stats_path, "Statistics"), (sizes_path, "Key sizes")):
+        stat_result = _stat_or_none(path)
+        if stat_result is None:
+            missing_files.append(f"{label} file not found: {path}")
+        else:
+            file_stats[str(path)] = stat_result
     
     if missing_files:
         print("Error: Missing required files:")
@@ -111,7 +122,8 @@ Examples:
         service = Delivery1Service(
             schema_path=str(schema_path),
             stats_path=str(stats_path),
-            key_sizes_path=str(sizes_path)
+            key_sizes_path=str(sizes_path),
+            file_stats=file_stats
         )
         
         success = service.run()
@@ -3,17 +3,40 @@ Delivery 1 Service
 Handles schema loading, object creation, examples, and size computation
 """
 
+import os
+import sys
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any
-from utils.load_file import FileLoaderFactory
+from typing import Dict, Any, Optional
+from utils.load_file import FileLoaderFactory, ijson
 from utils.schema_builder import SchemaBuilder
 from utils.size_computer import SizeComputer
 
 
+# Statistics files above this size are streamed collection by collection (requires ijson)
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+_total_size_bytes = itemgetter('total_size_bytes')
+
+# Thousands-separated integers, bound once for the display loops
+_fmt_int = "{:,}".format
+
+
+def _collection_total_size(item) -> int:
+    """Sort key for a (collection name, size metrics) pair"""
+    return _total_size_bytes(item[1])
+
+
 class Delivery1Service:
     """Service for Delivery 1: Schema to Object and Size Computation"""
     
-    def __init__(self, schema_path: str, stats_path: str, key_sizes_path: str):
+    def __init__(
+        self,
+        schema_path: str,
+        stats_path: str,
+        key_sizes_path: str,
+        file_stats: Optional[Dict[str, os.stat_result]] = None
+    ):
         """
         Initialize the service with file paths
         
@@ -21,15 +44,19 @@ class Delivery1Service:
             schema_path: Path to JSON schema file
             stats_path: Path to statistics JSON file
             key_sizes_path: Path to key sizes JSON file
+            file_stats: Optional {path: os.stat result} of files the caller already checked
         """
         self.schema_path = Path(schema_path)
         self.stats_path = Path(stats_path)
         self.key_sizes_path = Path(key_sizes_path)
+        self.file_stats = dict(file_stats or {})
         
         self.schema_data = None
         self.stats_data = None
+        self.key_sizes = None
         self.collections = None
         self.db_analysis = None
+        self._sorted_collections = None
     
     def load_files(self):
         """Load all required files"""
@@ -37,18 +64,22 @@ class Delivery1Service:
         print("LOADING FILES")
         print("="*70)
         
-        loader = FileLoaderFactory.registry['json']()
+        loader = FileLoaderFactory.registry['json'](file_stats=self.file_stats)
         
         print(f"\n   Loading schema: {self.schema_path.name}")
         self.schema_data = loader.load(str(self.schema_path))
         print(f"   Schema loaded successfully")
         
         print(f"\n   Loading statistics: {self.stats_path.name}")
-        self.stats_data = loader.load(str(self.stats_path))
-        print(f"   Statistics loaded successfully")
-        
-        print(f"\n   Using key sizes: {self.key_sizes_path.name}")
-        print(f"   Key sizes file configured")
+        if self._stream_statistics():
+            print(f"   Statistics file is large, collections will be streamed")
+        else:
+            self.stats_data = loader.load(str(self.stats_path))
+            print(f"   Statistics loaded successfully")
+        
+        print(f"\n   Loading key sizes: {self.key_sizes_path.name}")
+        self.key_sizes = loader.load(str(self.key_sizes_path))
+        print(f"   Key sizes loaded successfully")
     
     def build_collections(self):
         """Build dataclasses from schema"""
@@ -71,72 +102,96 @@ class Delivery1Service:
     
     def compute_sizes(self):
         """Compute sizes for all collections and database"""
-        print("\n" + "="*70)
-        print("COMPUTING DATABASE SIZES")
-        print("="*70)
+        lines = [
+            "\n" + "="*70,
+            "COMPUTING DATABASE SIZES",
+            "="*70
+        ]
+        
+        # Large statistics files are read one collection entry at a time
+        statistics = self.stats_data
+        database_info = None
+        if self._stream_statistics():
+            stream_loader = FileLoaderFactory.registry['json-stream']
+            statistics = stream_loader(prefix='collections', file_stats=self.file_stats).load(str(self.stats_path))
+            database_info = stream_loader(prefix='database', file_stats=self.file_stats).load_object(str(self.stats_path))
         
         # Compute database size
         self.db_analysis = SizeComputer.compute_database_size(
             collections=self.collections,
-            statistics=self.stats_data,
-            key_sizes_path=str(self.key_sizes_path)
+            statistics=statistics,
+            key_sizes_path=str(self.key_sizes_path),
+            database_info=database_info,
+            key_sizes=self.key_sizes
+        )
+        
+        # Sorted once by size, shared by the breakdown and the summary
+        self._sorted_collections = sorted(
+            self.db_analysis['collections'].items(),
+            key=_collection_total_size,
+            reverse=True
         )
         
         # Display database overview
-        print(f"\n   Database: {self.db_analysis['database_name']}")
-        print(f"   Description: {self.db_analysis['database_description']}")
-        print(f"   Total Collections: {self.db_analysis['total_collections']}")
-        print(f"   Total Documents: {self.db_analysis['total_documents']:,}")
-        print(f"   Total Size: {SizeComputer.format_size(self.db_analysis['total_size_bytes'])}")
-        print(f"              ({self.db_analysis['total_size_gb']:.2f} GB)")
+        lines.append(f"\n   Database: {self.db_analysis['database_name']}")
+        lines.append(f"   Description: {self.db_analysis['database_description']}")
+        lines.append(f"   Total Collections: {self.db_analysis['total_collections']}")
+        lines.append(f"   Total Documents: {_fmt_int(self.db_analysis['total_documents'])}")
+        lines.append(f"   Total Size: {SizeComputer.format_size(self.db_analysis['total_size_bytes'])}")
+        lines.append(f"              ({self.db_analysis['total_size_gb']:.2f} GB)")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_size_breakdown(self):
         """Display detailed size breakdown for each collection"""
-        print("\n" + "="*70)
-        print("COLLECTION SIZE BREAKDOWN")
-        print("="*70)
+        lines = [
+            "\n" + "="*70,
+            "COLLECTION SIZE BREAKDOWN",
+            "="*70
+        ]
         
-        # Sort collections by size
-        sorted_collections = sorted(
-            self.db_analysis['collections'].items(),
-            key=lambda x: x[1]['total_size_bytes'],
-            reverse=True
-        )
-        
-        for col_name, col_size in sorted_collections:
+        for col_name, col_size in self._sorted_collections:
             percentage = (col_size['total_size_bytes'] / self.db_analysis['total_size_bytes']) * 100
             
-            print(f"\n    {col_name}")
-            print(f"      Documents: {col_size['document_count']:,}")
-            print(f"      Avg Doc Size: {col_size['avg_document_size_bytes']:,} bytes")
-            print(f"      Total Size: {SizeComputer.format_size(col_size['total_size_bytes'])}")
-            print(f"      Percentage: {percentage:.2f}%")
+            lines.append(f"\n    {col_name}")
+            lines.append(f"      Documents: {_fmt_int(col_size['document_count'])}")
+            lines.append(f"      Avg Doc Size: {_fmt_int(col_size['avg_document_size_bytes'])} bytes")
+            lines.append(f"      Total Size: {SizeComputer.format_size(col_size['total_size_bytes'])}")
+            lines.append(f"      Percentage: {percentage:.2f}%")
             
             # Visual bar
             bar_length = min(50, int(percentage / 2))
-            bar = "█" * bar_length
-            print(f"      [{bar}]")
+            lines.append("      [" + "█" * bar_length + "]")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_summary(self):
         """Display final summary"""
-        print("\n" + "="*70)
-        print(" SUMMARY")
-        print("="*70)
-        
-        print(f"\n    Successfully created {len(self.collections)} dataclasses from JSON Schema")
-        print(f"    Computed size for {self.db_analysis['total_collections']} collections")
-        print(f"    Total database size: {SizeComputer.format_size(self.db_analysis['total_size_bytes'])}")
+        lines = [
+            "\n" + "="*70,
+            " SUMMARY",
+            "="*70,
+            f"\n    Successfully created {len(self.collections)} dataclasses from JSON Schema",
+            f"    Computed size for {self.db_analysis['total_collections']} collections",
+            f"    Total database size: {SizeComputer.format_size(self.db_analysis['total_size_bytes'])}"
+        ]
         
         # Top 3 largest collections
-        sorted_collections = sorted(
-            self.db_analysis['collections'].items(),
-            key=lambda x: x[1]['total_size_bytes'],
-            reverse=True
-        )
+        lines.append(f"\n    Top 3 largest collections:")
+        for i, (col_name, col_size) in enumerate(self._sorted_collections[:3], 1):
+            lines.append(f"      {i}. {col_name}: {SizeComputer.format_size(col_size['total_size_bytes'])}")
         
-        print(f"\n    Top 3 largest collections:")
-        for i, (col_name, col_size) in enumerate(sorted_collections[:3], 1):
-            print(f"      {i}. {col_name}: {SizeComputer.format_size(col_size['total_size_bytes'])}")
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def _stream_statistics(self) -> bool:
+        """Whether the statistics file is too large to be loaded at once"""
+        # Without ijson streaming would parse the whole file anyway, twice
+        if ijson is None:
+            return False
+        stat_result = self.file_stats.get(str(self.stats_path))
+        if stat_result is None:
+            stat_result = self.file_stats[str(self.stats_path)] = self.stats_path.stat()
+        return stat_result.st_size > STREAMING_THRESHOLD_BYTES
     
     def run(self):
         """Execute the complete delivery 1 workflow"""
@@ -1,8 +1,31 @@
+import os
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from typing import Callable
 from venv import logger
 from pathlib import Path
-import json
+
+# Prefer a C-accelerated parser when one is installed, stdlib json otherwise
+try:
+    import orjson as json_parser
+except ImportError:
+    try:
+        import ujson as json_parser
+    except ImportError:
+        import json as json_parser
+
+# Incremental parser used to stream very large files, optional
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+@lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int):
+    """ Parse a json file once per (absolute path, modification time), callers share the result """
+    with open(path, 'rb') as f:
+        return json_parser.loads(f.read())
 
 class FileLoaderBase(metaclass=ABCMeta):
     """ Base class for a loader """
@@ -41,16 +64,23 @@ class FileLoaderFactory:
 @FileLoaderFactory.register('json')
 class JsonFileLoader(FileLoaderBase):
     """ Json file loader"""
+    def __init__(self, file_stats: dict = None, **kwargs):
+        """ Constructor, file_stats holds the os.stat results of already checked paths """
+        super().__init__(**kwargs)
+        self.file_stats = file_stats or {}
+
     def load(self, path: str):
         file_path = Path(path)
         logger.info('Loading %s file ...', path)
     
         try:
-            if not self._check(file_path):
-                raise Exception("The file does not exist.")
-            with open(file_path, 'r') as f:
-                file = json.load(f)
-            return file
+            # Checked by the caller, its stat result gives the modification time
+            stat_result = self.file_stats.get(path)
+            if stat_result is None:
+                if not self._check(file_path):
+                    raise Exception("The file does not exist.")
+                stat_result = file_path.stat()
+            return _load_json_cached(os.path.abspath(path), stat_result.st_mtime_ns)
         except Exception as e:
             logger.error(e)
         
@@ -58,4 +88,58 @@ class JsonFileLoader(FileLoaderBase):
     
     def _check(self, file_path: Path):
         return file_path.exists()
-        
\ No newline at end of file
+
+
+@FileLoaderFactory.register('json-stream')
+class StreamingJsonFileLoader(FileLoaderBase):
+    """ Json file loader yielding the (key, value) pairs of one object lazily """
+    def __init__(self, prefix: str = 'collections', file_stats: dict = None, **kwargs):
+        """ Constructor, prefix is the ijson path of the object to stream, file_stats as for JsonFileLoader """
+        super().__init__(**kwargs)
+        self.prefix = prefix
+        self.file_stats = file_stats or {}
+
+    def load(self, path: str):
+        file_path = Path(path)
+        logger.info('Streaming %s file ...', path)
+
+        if not self._check(file_path):
+            logger.error("The file does not exist.")
+            return iter(())
+        return self._iter_items(file_path)
+
+    def load_object(self, path: str):
+        """ Return the whole object at the prefix, reading the file only until it ends """
+        file_path = Path(path)
+        logger.info('Reading %s from %s ...', self.prefix, path)
+
+        if not self._check(file_path):
+            logger.error("The file does not exist.")
+            return {}
+        if ijson is None:
+            return self._select(self._parse(file_path))
+        with open(file_path, 'rb') as f:
+            return next(ijson.items(f, self.prefix, use_float=True), {})
+
+    def _iter_items(self, file_path: Path):
+        if ijson is None:
+            # Without ijson the whole file has to be parsed first
+            yield from self._select(self._parse(file_path)).items()
+            return
+
+        with open(file_path, 'rb') as f:
+            yield from ijson.kvitems(f, self.prefix, use_float=True)
+
+    def _select(self, data):
+        for key in self.prefix.split('.'):
+            data = data.get(key, {})
+        return data
+
+    @staticmethod
+    def _parse(file_path: Path):
+        # Parsed outside the JsonFileLoader cache, a streamed file must not stay in memory
+        with open(file_path, 'rb') as f:
+            return json_parser.loads(f.read())
+
+    def _check(self, file_path: Path):
+        return str(file_path) in self.file_stats or file_path.exists()
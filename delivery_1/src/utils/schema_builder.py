@@ -9,6 +9,10 @@ class SchemaBuilder:
     
     def __init__(self, schema: Dict[str, Any]):
         self.schema: Dict[str, Any] = schema
+        # One dataclass per collection / nested object, shared by every reference
+        self._class_cache: Dict[str, type] = {}
+        # One Enum per distinct set of values, whatever field declares it
+        self._enum_cache: Dict[tuple, type] = {}
     
     def create_dataclass_from_collection(self, collection_name: str):
         """
@@ -21,6 +25,9 @@ class SchemaBuilder:
             a data class corresponding to the collection
         """
         
+        if collection_name in self._class_cache:
+            return self._class_cache[collection_name]
+        
         collection_def = self.schema.get("properties", {}).get(collection_name)
         if not collection_def:
             raise ValueError(f"Collection '{collection_name}' not found in schema")
@@ -49,7 +56,8 @@ class SchemaBuilder:
         
         fields_list = required_fields_list + optional_fields_list
         
-        new_class = make_dataclass(collection_name, fields_list)
+        new_class = make_dataclass(collection_name, fields_list, slots=True)
+        self._class_cache[collection_name] = new_class
         return new_class
     
     def _get_python_type(self, field_def: Dict[str, Any], field_name: str = ""):
@@ -74,8 +82,11 @@ class SchemaBuilder:
         elif json_type == "string":
             if "enum" in field_def:
                 enum_values = field_def["enum"]
-                enum_name = f"{field_name.capitalize()}Enum" if field_name else "ValueEnum"
-                return Enum(enum_name, {val: val for val in enum_values})
+                enum_key = tuple(sorted(enum_values))
+                if enum_key not in self._enum_cache:
+                    enum_name = f"{field_name.capitalize()}Enum" if field_name else "ValueEnum"
+                    self._enum_cache[enum_key] = Enum(enum_name, {val: val for val in enum_values})
+                return self._enum_cache[enum_key]
             return str
         elif json_type == "boolean":
             return bool
@@ -112,6 +123,11 @@ class SchemaBuilder:
     def _create_nested_class(self, class_name: str, object_def: Dict[str, Any]):
         """Build nested classes for "object into object" """
         
+        # Structurally identical nested objects share the same dataclass
+        cache_key = json.dumps(object_def, sort_keys=True)
+        if cache_key in self._class_cache:
+            return self._class_cache[cache_key]
+        
         properties = object_def.get("properties", {})
         required_fields = set(object_def.get("required", []))
         
@@ -134,7 +150,8 @@ class SchemaBuilder:
 
         fields_list = required_fields_list + optional_fields_list
         
-        new_class = make_dataclass(class_name, fields_list)
+        new_class = make_dataclass(class_name, fields_list, slots=True)
+        self._class_cache[cache_key] = new_class
         return new_class
     
     def create_all_dataclasses(self) -> Dict[str, type]:
@@ -1,6 +1,77 @@
-from typing import Dict, Any, List, Optional, Union, get_origin, get_args
+from collections.abc import Iterable, Mapping
+from typing import Dict, Any, List, Optional, Tuple, Union, get_origin, get_args
+from dataclasses import fields
+from functools import lru_cache
+from operator import mul
 from pathlib import Path
-import json
+from utils.load_file import FileLoaderFactory
+
+# Shared "no statistics" value so documents without specifics hit the same plan
+_NO_SPECIFICS: Dict[str, Any] = {}
+
+# key_sizes entry used for each primitive python type
+_PRIMITIVE_SIZE_KEY: Dict[type, str] = {
+    int: "number",
+    float: "number",
+    bool: "number",
+    str: "string"
+}
+
+# (origin, args, resolved type) per field type, filled by _resolve
+_origin_cache: Dict[Any, Tuple[Any, Tuple[Any, ...], Any]] = {}
+
+
+def _resolve(field_type: Any) -> Tuple[Any, Tuple[Any, ...], Any]:
+    """
+    Resolve the typing information of a field type once
+    
+    Returns:
+        (origin, args, type) of the field type, Optional[X] being unwrapped to X
+    """
+    resolved = _origin_cache.get(field_type)
+    if resolved is None:
+        origin = get_origin(field_type)
+        
+        # Handle Optional types (Optional[X] is Union[X, None])
+        if origin is Union:
+            # Noneyype
+            non_none_types = [arg for arg in get_args(field_type) if arg is not type(None)]
+            if non_none_types:
+                resolved_type = non_none_types[0]
+                resolved = (get_origin(resolved_type), get_args(resolved_type), resolved_type)
+        
+        if resolved is None:
+            resolved = (origin, get_args(field_type), field_type)
+        _origin_cache[field_type] = resolved
+    return resolved
+
+
+def _unit_sizes(key_sizes: Dict[str, int]) -> Tuple[int, int, int, int, int]:
+    """
+    Unpack the key sizes used by the size plans
+    
+    Returns:
+        (number, string, date, long_string, key_value_pair overhead)
+    """
+    return (
+        key_sizes.get("number", 8),
+        key_sizes.get("string", 80),
+        key_sizes.get("date", 20),
+        key_sizes.get("long_string", 200),
+        key_sizes.get("key_value_pair", 12)
+    )
+
+
+def _reduce_sizes(doc_counts: List[int], avg_sizes: List[int]) -> Tuple[List[int], int, int]:
+    """
+    Numeric reduction of compute_database_size, kept out of the per-collection loop
+    
+    Returns:
+        (total bytes per collection, database total bytes, database total documents)
+    """
+    totals = list(map(mul, doc_counts, avg_sizes))
+    return totals, sum(totals), sum(doc_counts)
+
 
 class SizeComputer:
     """Static methods to compute database, collection, and document sizes"""
@@ -13,6 +84,11 @@ class SizeComputer:
         "long_string": 200
     }
     
+    # Size plans of dataclasses without statistics, built once per (dataclass, unpacked key sizes)
+    # and replayed, the whole cache is dropped as soon as other key size values are used
+    _plan_cache: Dict[Tuple[type, Tuple[int, ...]], List[Tuple[int, int, float]]] = {}
+    _plan_unit_sizes: Tuple[int, ...] = None
+    
     @staticmethod
     def load_key_sizes(key_sizes_path: str = None) -> Dict[str, int]:
         """
@@ -22,11 +98,13 @@ class SizeComputer:
             key_sizes_path: Path to key_sizes.json file
             
         Returns:
-            Dictionary of type sizes
+            Dictionary of type sizes, the caller's own copy
         """
         if key_sizes_path and Path(key_sizes_path).exists():
-            with open(key_sizes_path, 'r') as f:
-                return json.load(f)
+            loader = FileLoaderFactory.registry['json']()
+            key_sizes = loader.load(key_sizes_path)
+            # The loader's result is shared through its cache
+            return dict(key_sizes) if key_sizes is not None else None
         return SizeComputer.DEFAULT_SIZES.copy()
     
     @staticmethod
@@ -49,68 +127,105 @@ class SizeComputer:
         Returns:
             Size in bytes
         """
+        # Entry point for external callers, size plans use _field_plan_entry directly
+        base_size, overhead, presence_factor = SizeComputer._field_plan_entry(
+            field_type,
+            field_name,
+            key_sizes,
+            field_specifics,
+            field_format
+        )
+        
+        # final size
+        return int((base_size + overhead) * presence_factor)
+    
+    @staticmethod
+    def _field_plan_entry(
+        field_type: type,
+        field_name: str,
+        key_sizes: Dict[str, int],
+        field_specifics: Dict[str, Any] = None,
+        field_format: str = "",
+        unit_sizes: Tuple[int, int, int, int, int] = None
+    ) -> Tuple[int, int, float]:
+        """
+        Resolve a field into its (base_size, overhead, presence_factor) plan entry
+        
+        Args:
+            unit_sizes: Optional key sizes already unpacked by _unit_sizes
+        
+        Returns:
+            Tuple whose (base_size + overhead) * presence_factor is the field size
+        """
         if field_specifics is None:
             field_specifics = {}
         
-        avg_length = field_specifics.get("avg_length")
+        if unit_sizes is None:
+            unit_sizes = _unit_sizes(key_sizes)
+        number, string, date, long_string, overhead = unit_sizes
+        
         null_percentage = field_specifics.get("null_percentage", 0)
         
-        # Get the origin type
-        origin = get_origin(field_type)
+        # A field that is always null is never stored, skip resolving its type
+        if null_percentage >= 100:
+            return 0, 0, 0
         
-        # Handle Optional types (Optional[X] is Union[X, None])
-        if origin is Union:
-            args = get_args(field_type)
-            # Noneyype
-            non_none_types = [arg for arg in args if arg is not type(None)]
-            if non_none_types:
-                field_type = non_none_types[0]
-                origin = get_origin(field_type)
+        avg_length = field_specifics.get("avg_length")
+        
+        # Fast path: plain primitives are resolved with a single dict lookup
+        size_key = _PRIMITIVE_SIZE_KEY.get(field_type)
+        origin = args = None
+        
+        if size_key is None:
+            # Get the origin type, Optional[X] being unwrapped to X
+            origin, args, field_type = _resolve(field_type)
+            size_key = _PRIMITIVE_SIZE_KEY.get(field_type)
         
         base_size = 0
         
+        # primitive types
+        if size_key == "number":
+            base_size = number
+        
+        elif size_key == "string":
+            if avg_length:
+                base_size = avg_length
+            elif field_format == "date-time":
+                base_size = date
+            elif field_format == "long_string":
+                base_size = long_string
+            else:
+                base_size = string
+        
         # List types
-        if origin is list or origin is List:
-            args = get_args(field_type)
+        elif origin is list or origin is List:
             item_type = args[0] if args else str
             
             # Average number of items in the list
             avg_items = field_specifics.get("avg_items", 1)
             
-            # Recursively compute item size
-            item_size = SizeComputer.compute_field_size(
-                item_type, 
-                f"{field_name}_item",
+            # Item size is folded into this single entry when the plan is built
+            item_base, item_overhead, item_presence = SizeComputer._field_plan_entry(
+                item_type,
+                field_name,
                 key_sizes,
-                {},
-                field_format
+                _NO_SPECIFICS,
+                field_format,
+                unit_sizes
             )
+            item_size = int((item_base + item_overhead) * item_presence)
             
             # item_size * avg_items
             base_size = item_size * avg_items
         
-        # primitive types
-        elif field_type == int or field_type == float or field_type == bool:
-            base_size = key_sizes.get("number", 8)
-        
-        elif field_type == str:
-            if avg_length:
-                base_size = avg_length
-            elif field_format == "date-time":
-                base_size = key_sizes.get("date", 20)
-            elif field_format == "long_string":
-                base_size = key_sizes.get("long_string", 200)
-            else:
-                base_size = key_sizes.get("string", 80)
-        
         # Dict types
         elif origin is dict or origin is Dict:
             # Let's say it is like a long_string
-            base_size = key_sizes.get("long_string", 200)
+            base_size = long_string
         
         # nested dataclasses
         elif hasattr(field_type, '__dataclass_fields__'):
-            nested_specifics = field_specifics.get("nested_fields", {})
+            nested_specifics = field_specifics.get("nested_fields", _NO_SPECIFICS)
             base_size = SizeComputer.compute_dataclass_size(
                 field_type,
                 key_sizes,
@@ -119,18 +234,12 @@ class SizeComputer:
         
         else:
             # As default let's use the string size
-            base_size = key_sizes.get("string", 80)
-        
-        # Add key-value pair overhead
-        overhead = key_sizes.get("key_value_pair", 12)
+            base_size = string
         
-        # field doesn't exist if null
-        presence_factor = 1 - (null_percentage / 100)
+        # field doesn't exist if null, always present fields stay in integer math
+        presence_factor = 1 - (null_percentage / 100) if null_percentage else 1
         
-        # final size
-        total_size = (base_size + overhead) * presence_factor
-        
-        return int(total_size)
+        return base_size, overhead, presence_factor
     
     @staticmethod
     def compute_dataclass_size(
@@ -150,30 +259,69 @@ class SizeComputer:
             Average document size in bytes
         """
         if field_specifics is None:
-            field_specifics = {}
+            field_specifics = _NO_SPECIFICS
         
         if not hasattr(dataclass_type, '__dataclass_fields__'):
             raise ValueError(f"{dataclass_type} is not a dataclass")
         
-        total_size = 0
+        plan = SizeComputer._get_plan(dataclass_type, key_sizes, field_specifics)
+        
+        return sum(int((base_size + overhead) * presence_factor)
+                   for base_size, overhead, presence_factor in plan)
+    
+    @staticmethod
+    def _get_plan(
+        dataclass_type: type,
+        key_sizes: Dict[str, int],
+        field_specifics: Dict[str, Dict[str, Any]]
+    ) -> List[Tuple[int, int, float]]:
+        """Return the cached size plan of a dataclass, building it on first use"""
+        # Statistics belong to the caller and can be edited in place, their plans are not cached
+        if field_specifics is not _NO_SPECIFICS:
+            return SizeComputer._build_plan(dataclass_type, key_sizes, field_specifics)
+        
+        # Keyed on the key size values, an in-place edit of key_sizes gives another plan
+        unit_sizes = _unit_sizes(key_sizes)
+        if SizeComputer._plan_unit_sizes != unit_sizes:
+            SizeComputer._plan_cache.clear()
+            SizeComputer._plan_unit_sizes = unit_sizes
+        
+        cache_key = (dataclass_type, unit_sizes)
+        plan = SizeComputer._plan_cache.get(cache_key)
+        if plan is None:
+            plan = SizeComputer._build_plan(dataclass_type, key_sizes, field_specifics)
+            SizeComputer._plan_cache[cache_key] = plan
+        return plan
+    
+    @staticmethod
+    def _build_plan(
+        dataclass_type: type,
+        key_sizes: Dict[str, int],
+        field_specifics: Dict[str, Dict[str, Any]]
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Walk the dataclass fields once and resolve each of them to a plan entry
+        
+        Returns:
+            List of (base_size, overhead, presence_factor), one per field
+        """
+        plan = []
+        
+        # Key sizes are read once for the whole plan
+        unit_sizes = _unit_sizes(key_sizes)
         
         # Iterate through all fields
-        for field_name, field_info in dataclass_type.__dataclass_fields__.items():
-            field_type = field_info.type
-            field_format = field_info.metadata.get("format")
-            specifics = field_specifics.get(field_name, {})
-            
-            field_size = SizeComputer.compute_field_size(
-                field_type,
-                field_name,
+        for field_info in fields(dataclass_type):
+            plan.append(SizeComputer._field_plan_entry(
+                field_info.type,
+                field_info.name,
                 key_sizes,
-                specifics,
-                field_format
-            )
-            
-            total_size += field_size
+                field_specifics.get(field_info.name, {}),
+                field_info.metadata.get("format"),
+                unit_sizes
+            ))
         
-        return total_size
+        return plan
     
     @staticmethod
     def compute_collection_size(
@@ -200,8 +348,19 @@ class SizeComputer:
             field_specifics
         )
         
-        total_size_bytes = document_count * avg_doc_size
-        
+        return SizeComputer._collection_metrics(
+            document_count,
+            avg_doc_size,
+            document_count * avg_doc_size
+        )
+    
+    @staticmethod
+    def _collection_metrics(
+        document_count: int,
+        avg_doc_size: int,
+        total_size_bytes: int
+    ) -> Dict[str, Any]:
+        """Build the size metrics dictionary of a collection"""
         return {
             "document_count": document_count,
             "avg_document_size_bytes": avg_doc_size,
@@ -214,47 +373,66 @@ class SizeComputer:
     @staticmethod
     def compute_database_size(
         collections: Dict[str, type],
-        statistics: Dict[str, Any],
-        key_sizes_path: str = None
+        statistics: Union[Dict[str, Any], Iterable[Tuple[str, Dict[str, Any]]]],
+        key_sizes_path: str = None,
+        database_info: Dict[str, Any] = None,
+        key_sizes: Dict[str, int] = None
     ) -> Dict[str, Any]:
         """
         Compute the total size of the database
         
         Args:
             collections: Dictionary of {collection_name: dataclass_type}
-            statistics: Statistics dictionary from JSON file
+            statistics: Statistics dictionary from JSON file, or an iterable of
+                (collection_name, collection_stats) pairs when streamed
             key_sizes_path: Optional path to key_sizes.json
+            database_info: Optional "database" entry, used with streamed statistics
+            key_sizes: Optional already loaded key sizes, key_sizes_path is then ignored
             
         Returns:
             Dictionary with database-wide size metrics
         """
-        key_sizes = SizeComputer.load_key_sizes(key_sizes_path)
+        if key_sizes is None:
+            key_sizes = SizeComputer.load_key_sizes(key_sizes_path)
         
-        database_info = statistics.get("database", {})
-        collections_stats = statistics.get("collections", {})
+        if isinstance(statistics, Mapping):
+            database_info = statistics.get("database", {})
+            collections_stats = statistics.get("collections", {})
+            stats_items = (
+                (col_name, collections_stats[col_name])
+                for col_name in collections
+                if col_name in collections_stats
+            )
+        else:
+            database_info = database_info or {}
+            stats_items = (
+                (col_name, col_stats)
+                for col_name, col_stats in statistics
+                if col_name in collections
+            )
         
-        collection_sizes = {}
-        total_bytes = 0
-        total_docs = 0
+        # Prepass: document count and plan-based average size per collection
+        col_names = []
+        doc_counts = []
+        avg_sizes = []
         
-        for col_name, dataclass_type in collections.items():
-            if col_name not in collections_stats:
-                continue
-            
-            col_stats = collections_stats[col_name]
-            document_count = col_stats.get("document_count", 0)
-            field_specifics = col_stats.get("field_specifics", {})
-            
-            col_size = SizeComputer.compute_collection_size(
+        for col_name, col_stats in stats_items:
+            dataclass_type = collections[col_name]
+            col_names.append(col_name)
+            doc_counts.append(col_stats.get("document_count", 0))
+            avg_sizes.append(SizeComputer.compute_dataclass_size(
                 dataclass_type,
-                document_count,
                 key_sizes,
-                field_specifics
-            )
-            
-            collection_sizes[col_name] = col_size
-            total_bytes += col_size["total_size_bytes"]
-            total_docs += col_size["document_count"]
+                col_stats.get("field_specifics", _NO_SPECIFICS)
+            ))
+        
+        totals, total_bytes, total_docs = _reduce_sizes(doc_counts, avg_sizes)
+        
+        collection_sizes = {
+            col_name: SizeComputer._collection_metrics(document_count, avg_doc_size, total_size_bytes)
+            for col_name, document_count, avg_doc_size, total_size_bytes
+            in zip(col_names, doc_counts, avg_sizes, totals)
+        }
         
         return {
             "database_name": database_info.get("name", "unknown"),
@@ -280,8 +458,14 @@ class SizeComputer:
         Returns:
             Formatted string (e.g., "1.5 GB")
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1000.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1000.0
-        return f"{bytes_value:.2f} PB"
+        return _format_size(bytes_value)
+
+
+@lru_cache(maxsize=2048)
+def _format_size(bytes_value: float) -> str:
+    """Human readable size, cached since the same totals are displayed several times"""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if bytes_value < 1000.0:
+            return f"{bytes_value:.2f} {unit}"
+        bytes_value /= 1000.0
+    return f"{bytes_value:.2f} PB"
@@ -38,17 +38,19 @@ class AggregateOperator:
         
         # Estimation du nombre de groupes distincts
         # Pour simplifier, on peut utiliser le doc_count / occurrence moyenne
+        # Read from the caller's statistics on every run, they may have changed since the last one
+        specifics = col_stats.get("field_specifics", {})
         distinct_count = n_in
         for key in self.group_keys:
-            field_stats = col_stats.get("field_specifics", {}).get(key, {})
-            if "distinct_values" in field_stats:
-                distinct_count = min(distinct_count, field_stats["distinct_values"])
+            distinct_values = specifics.get(key, {}).get("distinct_values")
+            if distinct_values is not None:
+                distinct_count = min(distinct_count, distinct_values)
 
+        # Taille simulée des champs
         avg_doc_size = 0
         for key in self.output_keys:
-            field_stats = col_stats.get("field_specifics", {}).get(key, {})
-            # Taille simulée du champ
-            avg_doc_size += field_stats.get("avg_length", 10)
+            avg_length = specifics.get(key, {}).get("avg_length")
+            avg_doc_size += 10 if avg_length is None else avg_length
 
         total_size_bytes = distinct_count * avg_doc_size
 
@@ -1,16 +1,20 @@
 # src/operators/aggregate_sharded_operator.py
-from operators.base_operator import BaseOperator
+from operators.base_operator import (
+    COST_MODEL_PATH, KEY_SIZES_PATH, SCHEMA_PATH, STATISTICS_PATH,
+    BaseOperator, get_all_dataclasses, get_key_sizes,
+)
 from operators.cost_model import CostModel
-from utils.size_computer import SizeComputer
-from utils.schema_builder import SchemaBuilder
-import json
-from pathlib import Path
+from operators.planning_context import PlanningContext, default_context
+from utils.statistics_helper import column_lookup
+import math
 
 
 class AggregateShardedOperator(BaseOperator):
     """
     Simule un Aggregate avec sharding, basé sur les statistiques uniquement.
     """
+    __slots__ = ("group_keys", "agg_key", "sharding_info", "statistics", "schema_builder")
+
     def __init__(
         self,
         collection,
@@ -22,22 +26,21 @@ class AggregateShardedOperator(BaseOperator):
         sharding_info=None,
         statistics=None,
         schema_builder=None,
+        context=None,
     ):
-        super().__init__(collection, output_keys, filter_key, selectivity)
+        super().__init__(collection, output_keys, filter_key, selectivity, context)
         self.group_keys = group_keys
         self.agg_key = agg_key
         self.sharding_info = sharding_info or {"nb_shards": 2, "shard_key": "id", "distribution": "uniform"}
         self.statistics = statistics
         self.schema_builder = schema_builder
 
-    def run(self):
-        # Charger stats et schema
-        stats = self.statistics or self._load_json(Path("../basic_statistic.json"))
-        schema = self.schema_builder or SchemaBuilder(self._load_json(Path("../basic_schema.json")))
+    def _run_impl(self):
+        # Stats, schema, tailles et modèle de coût partagés
+        ctx = self._planning_context()
 
         # Stats de la collection
-        col_stats = stats["collections"][self.collection]
-        n_in = int(col_stats["document_count"])
+        n_in = ctx.document_count(self.collection)
 
         # ------------------------
         # Étape filtre simulé
@@ -55,30 +58,22 @@ class AggregateShardedOperator(BaseOperator):
         # ------------------------
         # Nombre de groupes distincts simulé
         # ------------------------
-        distinct_count = n_in
-        for key in self.group_keys:
-            field_stats = col_stats.get("field_specifics", {}).get(key, {})
-            if "distinct_values" in field_stats:
-                distinct_count = min(distinct_count, field_stats["distinct_values"])
+        columns = ctx.columns(self.collection)
+        # Groups of independent keys: product of their distinct values, at most n_in
+        ndvs = [v for v in column_lookup(columns, "distinct_values", self.group_keys, None) if v is not None]
+        distinct_count = min(n_in, math.prod(ndvs)) if ndvs else n_in
         distinct_count_shard = distinct_count / nb_shards
 
         # ------------------------
         # Taille moyenne document output
         # ------------------------
-        dataclasses = schema.create_all_dataclasses()
-        dclass = dataclasses[self.collection]
-        key_sizes = SizeComputer.load_key_sizes("../key_sizes.json")
-        avg_doc_size = sum(
-            SizeComputer.compute_field_size(dclass.__dataclass_fields__[k].type, k, key_sizes, 
-                                            col_stats.get("field_specifics", {}).get(k, {}))
-            for k in self.output_keys if k in dclass.__dataclass_fields__
-        )
+        avg_doc_size = ctx.avg_projected(self.collection, self.output_keys)
         total_size_bytes = distinct_count * avg_doc_size
 
         # ------------------------
         # Coût avec CostModel
         # ------------------------
-        cm = CostModel.from_file("../cost_model.json")
+        cm = ctx.cost_model
         pages = cm.pages_read(n_in, avg_doc_size)
         io_cost = cm.io_cost(pages)
         cpu_cost = cm.cpu_cost_per_tuple(n_in)
@@ -102,8 +97,19 @@ class AggregateShardedOperator(BaseOperator):
             }
         }
 
-    def _load_json(self, path: Path):
-        if not path.exists():
-            raise FileNotFoundError(f"Missing file: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+    def _planning_context(self) -> PlanningContext:
+        if self.context:
+            return self.context
+        if self.statistics is None and self.schema_builder is None:
+            return default_context()
+        # Caller-provided statistics or schema builder may change between runs: context for this run only
+        if self.schema_builder:
+            dataclasses = self.schema_builder.create_all_dataclasses()
+        else:
+            dataclasses = get_all_dataclasses(SCHEMA_PATH)
+        return PlanningContext(
+            self.statistics or self._load_json(STATISTICS_PATH),
+            dataclasses,
+            get_key_sizes(KEY_SIZES_PATH),
+            CostModel.from_file(str(COST_MODEL_PATH)),
+        )
@@ -1,6 +1,8 @@
 
 class OperatorInput:
     """Common input structure for all operators"""
+    __slots__ = ("collection_name", "output_keys", "filter_key", "selectivity")
+
     def __init__(self, collection_name, output_keys, filter_key, selectivity=None):
         self.collection_name = collection_name
         self.output_keys = output_keys
@@ -10,6 +12,8 @@ class OperatorInput:
 
 class OperatorOutput:
     """Common output structure for all operators"""
+    __slots__ = ("output_doc_count", "output_size_bytes", "costs")
+
     def __init__(self, output_doc_count, output_size_bytes, costs):
         self.output_doc_count = output_doc_count
         self.output_size_bytes = output_size_bytes
@@ -1,12 +1,117 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+import sys
+
+from utils.load_file import load_json
+from utils.schema_builder import SchemaBuilder
+from utils.size_computer import SizeComputer
+
+
+@lru_cache(maxsize=4)
+def _dataclasses_cached(path_str: str, mtime_ns: int) -> dict:
+    # Dataclasses built once per (schema path, modification time)
+    return SchemaBuilder(load_json(Path(path_str))).create_all_dataclasses()
+
+
+def get_all_dataclasses(path: Path) -> dict:
+    # {collection: dataclass} of a schema file, built once and shared across operators
+    if not path.exists():
+        raise FileNotFoundError(f"Missing file: {path}")
+    return _dataclasses_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _key_sizes_cached(path_str: str, mtime_ns: int) -> dict:
+    return SizeComputer.load_key_sizes(path_str)
+
+
+def get_key_sizes(path: Path) -> dict:
+    # Key sizes loaded once per (path, modification time), defaults when missing
+    if not path.exists():
+        return SizeComputer.load_key_sizes(None)
+    return _key_sizes_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+# Default input files of the operators, relative to the working directory
+SCHEMA_PATH = Path("../basic_schema.json")
+STATISTICS_PATH = Path("../basic_statistic.json")
+KEY_SIZES_PATH = Path("../key_sizes.json")
+COST_MODEL_PATH = Path("../cost_model.json")
+
+# Files every operator result depends on, their mtimes are part of the memo key
+INPUT_FILES = (SCHEMA_PATH, STATISTICS_PATH, KEY_SIZES_PATH, COST_MODEL_PATH)
+
+# Results of equivalent sub-plans, keyed on the operator class and its arguments
+_RUN_CACHE_SIZE = 4096
+_run_cache = {}
+
+
+def _freeze(value):
+    # Hashable equivalent of an operator argument
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls) -> tuple:
+    # Every slot declared along an operator's class hierarchy, base classes first
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(names)
+
+
+def _intern(value):
+    # Collection and field names are interned, anything else (e.g. dict filters) is kept as is
+    return sys.intern(value) if type(value) is str else value
+
+
+def input_mtimes() -> tuple:
+    # Modification times of the input files, None for a missing one
+    return tuple(p.stat().st_mtime_ns if p.exists() else None for p in INPUT_FILES)
+
+
+def _copy_result(result: dict) -> dict:
+    # Results are two levels deep ("costs"), callers get their own copy
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in result.items()}
+
 
 class BaseOperator(ABC):
-    def __init__(self, collection, output_keys, filter_key=None, selectivity=None):
-        self.collection = collection
-        self.output_keys = output_keys
-        self.filter_key = filter_key
+    __slots__ = ("collection", "output_keys", "filter_key", "selectivity", "context")
+
+    def __init__(self, collection, output_keys, filter_key=None, selectivity=None, context=None):
+        self.collection = _intern(collection)
+        self.output_keys = tuple(_intern(k) for k in output_keys)
+        self.filter_key = _intern(filter_key)
         self.selectivity = selectivity or 0.1
+        # Shared PlanningContext, None uses the one over the default input files
+        self.context = context
 
-    @abstractmethod
     def run(self):
+        # Caller-provided contexts, statistics or schema builders can change between runs, no memoization
+        if (self.context is not None or getattr(self, "statistics", None) is not None
+                or getattr(self, "schema_builder", None) is not None):
+            return self._run_impl()
+
+        args = tuple(_freeze(getattr(self, name)) for name in _slot_names(type(self)))
+        key = (type(self), args, input_mtimes())
+        result = _run_cache.get(key)
+        if result is None:
+            result = self._run_impl()
+            if len(_run_cache) >= _RUN_CACHE_SIZE:
+                del _run_cache[next(iter(_run_cache))]
+            _run_cache[key] = result
+        return _copy_result(result)
+
+    @abstractmethod
+    def _run_impl(self):
         pass
+
+    @staticmethod
+    def _load_json(path: Path):
+        return load_json(path)
@@ -1,8 +1,10 @@
 
-import json, math
+import math
 from pathlib import Path
 from typing import Optional
 
+from utils.load_file import load_json
+
 
 _DEFAULTS = {
     "page_size": 4096,
@@ -12,6 +14,31 @@ _DEFAULTS = {
     "net_cost_per_byte": 0.0000025,
 }
 
+
+def _pages_read(n_in, avg_doc_size_bytes, page_size) -> int:
+    if n_in <= 0 or avg_doc_size_bytes <= 0:
+        return 0
+    if isinstance(n_in, int) and isinstance(avg_doc_size_bytes, int) and isinstance(page_size, int):
+        # Integer ceil-division, a positive byte count always gives at least one page
+        return -(-(n_in * avg_doc_size_bytes) // page_size)
+    return max(1, math.ceil((n_in * avg_doc_size_bytes) / page_size))
+
+
+def _batch_cost(n_in, n_comp, bytes_xfer, avg_sz, page_size, page_cost, cpu_per_comp, net_cost_per_byte):
+    # Batch kernel: (io, cpu, network, total) cost lists, one entry per candidate.
+    # Module-level and working on numbers only, so it can be compiled on its own.
+    io, cpu, network, total = [], [], [], []
+    for n, comp, xfer, size in zip(n_in, n_comp, bytes_xfer, avg_sz):
+        io_cost = _pages_read(n, size, page_size) * page_cost
+        cpu_cost = comp * cpu_per_comp
+        network_cost = xfer * net_cost_per_byte
+        io.append(io_cost)
+        cpu.append(cpu_cost)
+        network.append(network_cost)
+        total.append(io_cost + cpu_cost + network_cost)
+    return io, cpu, network, total
+
+
 class CostModel:
     def __init__(self, cfg: dict):
         self.page_size = cfg.get("page_size", _DEFAULTS["page_size"])
@@ -20,41 +47,53 @@ class CostModel:
         self.cpu_per_comp = cfg.get("cpu_per_comp", _DEFAULTS["cpu_per_comp"])
         self.net_cost_per_byte = cfg.get("net_cost_per_byte", _DEFAULTS["net_cost_per_byte"])
 
+        # Non-negative coefficients keep every cost non-negative for non-negative inputs
+        if self.page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {self.page_size}")
+        for name in ("page_cost", "cpu_per_tuple", "cpu_per_comp", "net_cost_per_byte"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be non-negative, got {getattr(self, name)}")
+
     @classmethod
     def from_file(cls, path: Optional[str] = None):
          # Load configuration from file or use defaults
         if path and Path(path).exists():
-            with open(path, "r") as f:
-                return cls(json.load(f))
+            return cls(load_json(Path(path)))
         return cls(_DEFAULTS)
 
     def pages_read(self, n_in: int, avg_doc_size_bytes: float) -> int:
         # Estimate the number of pages read
-        if n_in <= 0 or avg_doc_size_bytes <= 0:
-            return 0
-        return max(1, math.ceil((n_in * avg_doc_size_bytes) / self.page_size))
+        return _pages_read(n_in, avg_doc_size_bytes, self.page_size)
 
     def io_cost(self, pages_read: int) -> float:
         # Estimate disk I/O cost: number of pages * cost per page
         # Represents the effort to read data from storage
-        return max(0.0, pages_read * self.page_cost)
+        return pages_read * self.page_cost
 
     def cpu_cost_per_tuple(self, n_in: int) -> float:
         # Estimate CPU cost for scanning/filtering tuples (documents)
         # Each processed document consumes a small CPU unit
-        return max(0.0, n_in * self.cpu_per_tuple)
+        return n_in * self.cpu_per_tuple
 
     def cpu_cost_comparisons(self, n_comp: int) -> float:
         # Estimate CPU cost for performing comparisons (e.g. joins)
         # Used when matching multiple tuples between collections
-        return max(0.0, n_comp * self.cpu_per_comp)
+        return n_comp * self.cpu_per_comp
 
     def network_cost(self, bytes_transferred: float) -> float:
         # Estimate cost for transferring data between nodes/shards
         # Depends on the total number of bytes sent over the networ
-        return max(0.0, bytes_transferred * self.net_cost_per_byte)
+        return bytes_transferred * self.net_cost_per_byte
 
     def total_cost(self, io_cost: float, cpu_cost: float, network_cost: float) -> float:
         # Total estimated cost
-        return max(0.0, io_cost + cpu_cost + network_cost)
+        return io_cost + cpu_cost + network_cost
+
+    def total_cost_batch(self, n_in, n_comp, bytes_xfer, avg_sz) -> list:
+        # Total cost of many candidate plans at once, one entry per candidate
+        # (pages read from n_in * avg_sz, comparisons, bytes sent over the network)
+        return _batch_cost(
+            n_in, n_comp, bytes_xfer, avg_sz,
+            self.page_size, self.page_cost, self.cpu_per_comp, self.net_cost_per_byte
+        )[3]
 
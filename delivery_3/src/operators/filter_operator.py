@@ -1,46 +1,27 @@
 from operators.base_operator import BaseOperator
-from operators.cost_model import CostModel
-from utils.size_computer import SizeComputer
-from utils.schema_builder import SchemaBuilder
-import json
-from pathlib import Path
+from operators.planning_context import default_context
 
 
 class FilterOperator(BaseOperator):
-    def run(self):
-        # Load all required input files
-        schema = self._load_json(Path("../basic_schema.json"))
-        stats = self._load_json(Path("../basic_statistic.json"))
-        key_sizes_path = Path("../key_sizes.json")
-        cost_model_path = Path("../cost_model.json")
+    __slots__ = ()
+
+    def _run_impl(self):
+        # Shared inputs and derived sizes
+        ctx = self.context or default_context()
 
         # Read statistics for the target collection
-        col_stats = stats["collections"][self.collection]
-        n_in = int(col_stats["document_count"])
+        n_in = ctx.document_count(self.collection)
         selectivity = float(self.selectivity or 0.1)
         n_out = int(n_in * selectivity)
 
         # Compute the average projected document size
-        schema_builder = SchemaBuilder(schema)
-        dclass = schema_builder.create_all_dataclasses()[self.collection]
-        key_sizes = SizeComputer.load_key_sizes(str(key_sizes_path))
-        field_specs = col_stats.get("field_specifics", {})
-
-        avg_projected = 0
-        for key in self.output_keys:
-            if key in dclass.__dataclass_fields__:
-                avg_projected += SizeComputer.compute_field_size(
-                    dclass.__dataclass_fields__[key].type,
-                    key,
-                    key_sizes,
-                    field_specs.get(key, {})
-                )
+        avg_projected = ctx.avg_projected(self.collection, self.output_keys)
 
         total_size = n_out * avg_projected
 
         # Estimate execution costs using CostModel
-        cm = CostModel.from_file(str(cost_model_path))
-        pages = cm.pages_read(n_in, avg_projected)
+        cm = ctx.cost_model
+        pages = ctx.pages_for(self.collection, avg_projected)
         io_cost = cm.io_cost(pages)
         cpu_cost = cm.cpu_cost_per_tuple(n_in)
         network_cost = 0.0
@@ -59,11 +40,3 @@ class FilterOperator(BaseOperator):
                 "total_cost": total_cost
             }
         }
-
-    
-    def _load_json(self, path: Path):
-        if not path.exists():
-            raise FileNotFoundError(f"Missing file: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    
@@ -1,25 +1,19 @@
 from operators.base_operator import BaseOperator
-from operators.cost_model import CostModel
-from utils.size_computer import SizeComputer
-from utils.schema_builder import SchemaBuilder
-import json
-from pathlib import Path
+from operators.planning_context import default_context
 
 class FilterShardedOperator(BaseOperator):
-    def __init__(self, collection, output_keys, filter_key, selectivity=None, sharding_info=None):
-        super().__init__(collection, output_keys, filter_key, selectivity)
+    __slots__ = ("sharding_info",)
+
+    def __init__(self, collection, output_keys, filter_key, selectivity=None, sharding_info=None, context=None):
+        super().__init__(collection, output_keys, filter_key, selectivity, context)
         self.sharding_info = sharding_info or {"nb_shards": 2, "shard_key": "id", "distribution": "uniform"}
 
-    def run(self):
-        # Load all required input files
-        schema = self._load_json(Path("../basic_schema.json"))
-        stats = self._load_json(Path("../basic_statistic.json"))
-        key_sizes_path = Path("../key_sizes.json")
-        cost_model_path = Path("../cost_model.json")
+    def _run_impl(self):
+        # Shared inputs and derived sizes
+        ctx = self.context or default_context()
 
         # Read collection statistics
-        col_stats = stats["collections"][self.collection]
-        n_in = int(col_stats["document_count"])# total input documents
+        n_in = ctx.document_count(self.collection)# total input documents
         selectivity = float(self.selectivity or 0.1)# fraction passing the filter
 
         n_out = int(n_in * selectivity) # estimated output coun
@@ -30,19 +24,12 @@ class FilterShardedOperator(BaseOperator):
         n_out_shard = n_out / nb_shards
 
          # Compute the average projected document size
-        schema_builder = SchemaBuilder(schema)
-        dclass = schema_builder.create_all_dataclasses()[self.collection]
-        key_sizes = SizeComputer.load_key_sizes(str(key_sizes_path))
-        field_specs = col_stats.get("field_specifics", {})
-        avg_projected = sum(
-            SizeComputer.compute_field_size(dclass.__dataclass_fields__[k].type, k, key_sizes, field_specs.get(k, {}))
-            for k in self.output_keys if k in dclass.__dataclass_fields__
-        )
+        avg_projected = ctx.avg_projected(self.collection, self.output_keys)
         total_size = n_out * avg_projected
 
         # Compute costs using CostModel
-        cm = CostModel.from_file(str(cost_model_path))
-        pages = cm.pages_read(n_in, avg_projected)
+        cm = ctx.cost_model
+        pages = ctx.pages_for(self.collection, avg_projected)
         io_cost = cm.io_cost(pages)
         cpu_cost = cm.cpu_cost_per_tuple(n_in)
         network_cost = cm.network_cost(total_size / nb_shards)
@@ -62,9 +49,3 @@ class FilterShardedOperator(BaseOperator):
                 "total_cost": total_cost
             }
         }
-
-    def _load_json(self, path: Path):
-        if not path.exists():
-            raise FileNotFoundError(f"Missing file: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
@@ -1,5 +1,30 @@
+from collections import defaultdict
 from utils.size_computer import SizeComputer
 
+
+def _match_pairs(left_keys, right_keys):
+    """Index pairs (i, j) such that left_keys[i] == right_keys[j], nested-loop order"""
+    pairs = []
+    for i, lk in enumerate(left_keys):
+        for j, rk in enumerate(right_keys):
+            if lk == rk:
+                pairs.append((i, j))
+    return pairs
+
+
+def _hash_match_pairs(left_keys, right_keys):
+    """Same pairs as _match_pairs, found through a hash index on the right keys"""
+    index = defaultdict(list)
+    for j, rk in enumerate(right_keys):
+        index[rk].append(j)
+
+    pairs = []
+    for i, lk in enumerate(left_keys):
+        for j in index.get(lk, ()):
+            pairs.append((i, j))
+    return pairs
+
+
 class NestedLoopJoinOperator:
     """
     Simule un join nested loop entre deux collections.
@@ -21,18 +46,33 @@ class NestedLoopJoinOperator:
         self.statistics = statistics
         self.schema_builder = schema_builder
 
-    def run(self):
-        """Run join with real documents"""
+    def run(self, method: str = "hash"):
+        """
+        Run join with real documents.
+        method="hash" joins through a hash index on the right side,
+        method="nested" keeps the nested loop for cost model validation.
+        Unhashable join key values make the hash join fall back to the nested loop.
+        """
         if self.left_docs is None or self.right_docs is None:
             raise ValueError("Documents must be provided for real join")
+        if method not in ("hash", "nested"):
+            raise ValueError(f"Unknown join method: {method}")
+
+        # Compare the key columns only, documents are merged for matches alone
+        left_docs, right_docs = self.left_docs, self.right_docs
+        left_keys = [ldoc[self.left_key] for ldoc in left_docs]
+        right_keys = [rdoc[self.right_key] for rdoc in right_docs]
 
-        joined = []
-        for ldoc in self.left_docs:
-            for rdoc in self.right_docs:
-                if ldoc[self.left_key] == rdoc[self.right_key]:
-                    merged = {**ldoc, **rdoc}
-                    joined.append(merged)
-        return joined
+        pairs = None
+        if method == "hash":
+            try:
+                pairs = _hash_match_pairs(left_keys, right_keys)
+            except TypeError:
+                # Unhashable key values (e.g. arrays) can only be compared pairwise
+                pass
+        if pairs is None:
+            pairs = _match_pairs(left_keys, right_keys)
+        return [left_docs[i] | right_docs[j] for i, j in pairs]
 
     def run_simulated(self):
         """
@@ -1,13 +1,12 @@
 # src/operators/join_sharded_operator.py
 from operators.base_operator import BaseOperator
-from operators.cost_model import CostModel
-from utils.size_computer import SizeComputer
-from utils.schema_builder import SchemaBuilder
-import json
-from pathlib import Path
+from operators.planning_context import default_context
+from utils.statistics_helper import estimate_join_cardinality
 
 
 class NestedLoopJoinShardedOperator(BaseOperator):
+    __slots__ = ("right_collection", "join_selectivity", "input_cardinality", "sharding_info")
+
     def __init__(
         self,
         left_collection,
@@ -16,31 +15,41 @@ class NestedLoopJoinShardedOperator(BaseOperator):
         output_keys,
         selectivity=None,
         sharding_info=None,
+        input_cardinality=None,
+        context=None,
     ):
         # on utilise filter_key pour porter join_key comme dans les autres opérateurs
-        super().__init__(left_collection, output_keys, join_key, selectivity)
+        super().__init__(left_collection, output_keys, join_key, selectivity, context)
         self.right_collection = right_collection
+        # Explicit join selectivity, None lets the join key statistics decide
+        self.join_selectivity = selectivity
+        # Left input size after upstream operators (e.g. a filter's output_doc_count)
+        self.input_cardinality = input_cardinality
         self.sharding_info = sharding_info or {
             "nb_shards": 2,
             "shard_key": "id",
             "distribution": "uniform",
         }
 
-    def run(self):
-         # Load schema, stats, sizing and cost configs
-        schema = self._load_json(Path("../basic_schema.json"))
-        stats = self._load_json(Path("../basic_statistic.json"))
-        key_sizes_path = Path("../key_sizes.json")
-        cost_model_path = Path("../cost_model.json")
+    def _run_impl(self):
+        # Shared inputs and derived sizes
+        ctx = self.context or default_context()
 
         # Read input cardinalities for both sides
-        left_stats = stats["collections"][self.collection]
-        right_stats = stats["collections"][self.right_collection]
-        n_left = int(left_stats["document_count"])
-        n_right = int(right_stats["document_count"])
+        left_stats = ctx.collection_stats(self.collection)
+        right_stats = ctx.collection_stats(self.right_collection)
+        if self.input_cardinality is not None:
+            n_left = int(self.input_cardinality)
+        else:
+            n_left = ctx.document_count(self.collection)
+        n_right = ctx.document_count(self.right_collection)
 
-        join_selectivity = float(self.selectivity or 0.001)
-        n_out = int(n_left * n_right * join_selectivity)
+        n_out = None
+        if self.join_selectivity is None:
+            n_out = estimate_join_cardinality(n_left, n_right, left_stats, right_stats, self.filter_key)
+        if n_out is None:
+            join_selectivity = float(self.join_selectivity or 0.001)
+            n_out = int(n_left * n_right * join_selectivity)
 
         #Sharding
         nb_shards = self.sharding_info.get("nb_shards", 2)
@@ -48,21 +57,19 @@ class NestedLoopJoinShardedOperator(BaseOperator):
         co_located = (shard_key == self.filter_key)
 
         # Average joined row size (left doc size + right doc size)
-        schema_builder = SchemaBuilder(schema)
-        all_classes = schema_builder.create_all_dataclasses()
-        left_class = all_classes[self.collection]
-        right_class = all_classes[self.right_collection]
-        key_sizes = SizeComputer.load_key_sizes(str(key_sizes_path))
-
-        left_avg = SizeComputer.compute_dataclass_size(left_class, key_sizes)
-        right_avg = SizeComputer.compute_dataclass_size(right_class, key_sizes)
+        left_avg = ctx.doc_size(self.collection)
+        right_avg = ctx.doc_size(self.right_collection)
         avg_join_size = left_avg + right_avg
         total_size = n_out * avg_join_size
 
         # I/O and CPU costs
-        cm = CostModel.from_file(str(cost_model_path))
+        cm = ctx.cost_model
+        if self.input_cardinality is not None:
+            left_pages = cm.pages_read(n_left, left_avg)
+        else:
+            left_pages = ctx.pages_for(self.collection, left_avg)
         io_cost = cm.io_cost(
-            cm.pages_read(n_left, left_avg) + cm.pages_read(n_right, right_avg)
+            left_pages + ctx.pages_for(self.right_collection, right_avg)
         )
         cpu_cost = cm.cpu_cost_comparisons(n_left * n_right)
 
@@ -94,10 +101,3 @@ class NestedLoopJoinShardedOperator(BaseOperator):
                 "total_cost": total_cost,
             },
         }
-
-    
-    def _load_json(self, path: Path):
-        if not path.exists():
-            raise FileNotFoundError(f"Missing file: {path}")
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
@@ -0,0 +1,95 @@
+# src/operators/planning_context.py
+from functools import lru_cache
+
+from operators.base_operator import (
+    COST_MODEL_PATH, KEY_SIZES_PATH, SCHEMA_PATH, STATISTICS_PATH,
+    get_all_dataclasses, get_key_sizes, input_mtimes,
+)
+from operators.cost_model import CostModel
+from utils.load_file import load_json
+from utils.size_computer import SizeComputer
+from utils.statistics_helper import field_columns
+
+
+class PlanningContext:
+    """
+    Inputs shared by the operators of a plan (statistics, dataclasses, key sizes,
+    cost model), with the values derived from them computed once per context:
+    document counts, field and document sizes, pages read.
+    """
+
+    def __init__(self, statistics: dict, dataclasses: dict, key_sizes: dict, cost_model: CostModel):
+        self.statistics = statistics
+        self.dataclasses = dataclasses
+        self.key_sizes = key_sizes
+        self.cost_model = cost_model
+
+        self._field_sizes = {}
+        self._avg_projected = {}
+        self._doc_sizes = {}
+        self._columns = {}
+        self._pages = {}
+
+    def collection_stats(self, collection: str) -> dict:
+        return self.statistics["collections"][collection]
+
+    def document_count(self, collection: str) -> int:
+        return int(self.collection_stats(collection)["document_count"])
+
+    def field_sizes(self, collection: str) -> dict:
+        # {field: size} of a collection's top-level fields
+        sizes = self._field_sizes.get(collection)
+        if sizes is None:
+            table = SizeComputer.build_field_size_table(
+                {collection: self.dataclasses[collection]}, self.key_sizes, self.statistics
+            )
+            sizes = self._field_sizes[collection] = table[collection]
+        return sizes
+
+    def avg_projected(self, collection: str, keys) -> int:
+        # Average size of a document projected on keys (unknown keys are skipped)
+        memo_key = (collection, tuple(keys))
+        size = self._avg_projected.get(memo_key)
+        if size is None:
+            field_sizes = self.field_sizes(collection)
+            size = self._avg_projected[memo_key] = sum(field_sizes[k] for k in memo_key[1] if k in field_sizes)
+        return size
+
+    def doc_size(self, collection: str) -> int:
+        # Average size of a full document, without field statistics
+        size = self._doc_sizes.get(collection)
+        if size is None:
+            size = SizeComputer.compute_dataclass_size(self.dataclasses[collection], self.key_sizes)
+            self._doc_sizes[collection] = size
+        return size
+
+    def columns(self, collection: str) -> dict:
+        # field_specifics of a collection as statistic columns
+        columns = self._columns.get(collection)
+        if columns is None:
+            columns = self._columns[collection] = field_columns(self.collection_stats(collection))
+        return columns
+
+    def pages_for(self, collection: str, avg_doc_size) -> int:
+        # Pages read by a full scan of a collection with the given document size
+        memo_key = (collection, avg_doc_size)
+        pages = self._pages.get(memo_key)
+        if pages is None:
+            pages = self.cost_model.pages_read(self.document_count(collection), avg_doc_size)
+            self._pages[memo_key] = pages
+        return pages
+
+
+@lru_cache(maxsize=1)
+def _default_context_cached(mtimes: tuple) -> PlanningContext:
+    return PlanningContext(
+        load_json(STATISTICS_PATH),
+        get_all_dataclasses(SCHEMA_PATH),
+        get_key_sizes(KEY_SIZES_PATH),
+        CostModel.from_file(str(COST_MODEL_PATH)),
+    )
+
+
+def default_context() -> PlanningContext:
+    # Context over the default input files, rebuilt when one of them changes
+    return _default_context_cached(input_mtimes())
@@ -6,7 +6,8 @@ from operators.aggregate_sharded_operator import AggregateShardedOperator
 from operators.join_sharded_operator import NestedLoopJoinShardedOperator
 from utils.schema_builder import SchemaBuilder
 from utils.size_computer import SizeComputer
-import json
+from utils.load_file import load_json
+from pathlib import Path
 
 def Q6_aggregate_only( stats, builder: SchemaBuilder):
     # ------------------------
@@ -150,10 +151,8 @@ def Q6_sharded_aggregate(stats, builder):
 
 if __name__ == "__main__":
     # Charger le schema et les statistiques
-    with open("../basic_schema.json") as f:
-        schema_json = json.load(f)
-    with open("../basic_statistic.json") as f:
-        stats = json.load(f)
+    schema_json = load_json(Path("../basic_schema.json"))
+    stats = load_json(Path("../basic_statistic.json"))
 
     builder = SchemaBuilder(schema_json)
     # print("Schema loaded and dataclasses created.")
@@ -0,0 +1,48 @@
+
+import math
+from operators.cost_model import CostModel
+
+
+def _scalar_total(cm: CostModel, n_in, n_comp, bytes_xfer, avg_sz) -> float:
+    return cm.total_cost(
+        cm.io_cost(cm.pages_read(n_in, avg_sz)),
+        cm.cpu_cost_comparisons(n_comp),
+        cm.network_cost(bytes_xfer),
+    )
+
+
+def _check_batch(cm: CostModel, n_in, n_comp, bytes_xfer, avg_sz):
+    batch = cm.total_cost_batch(n_in, n_comp, bytes_xfer, avg_sz)
+    expected = [_scalar_total(cm, *args) for args in zip(n_in, n_comp, bytes_xfer, avg_sz)]
+    assert len(batch) == len(expected)
+    for got, want in zip(batch, expected):
+        assert math.isclose(got, want), (got, want)
+
+
+def test_batch_matches_scalar_int_pages():
+    cm = CostModel.from_file("../cost_model.json")
+    _check_batch(cm, [0, 1, 1000, 20000000], [0, 10, 5000, 10 ** 9],
+                 [0, 512, 4096, 10 ** 6], [0, 1, 4096, 152])
+
+
+def test_batch_matches_scalar_float_pages():
+    cm = CostModel.from_file("../cost_model.json")
+    _check_batch(cm, [1, 10, 1000.0, 2.5], [1, 1, 10, 3],
+                 [0.5, 100.0, 0, 1e6], [0.1, 409.6, 12.5, 4096.0])
+
+
+def test_pages_read_int_and_float_paths():
+    cm = CostModel({"page_size": 4096})
+    assert cm.pages_read(1, 1) == 1
+    assert cm.pages_read(4096, 1) == 1
+    assert cm.pages_read(4097, 1) == 2
+    assert cm.pages_read(10, 0.1) == 1
+    assert cm.pages_read(4097, 1.0) == 2
+    assert cm.pages_read(0, 100) == 0
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar_int_pages()
+    test_batch_matches_scalar_float_pages()
+    test_pages_read_int_and_float_paths()
+    print("Cost model checks passed")
@@ -0,0 +1,65 @@
+
+import copy
+from operators.join_nested_operator import NestedLoopJoinOperator
+from operators.join_sharded_operator import NestedLoopJoinShardedOperator
+from operators.planning_context import PlanningContext, default_context
+from utils.statistics_helper import estimate_join_cardinality
+
+JOIN_OPERATORS = (NestedLoopJoinOperator, NestedLoopJoinShardedOperator)
+
+
+def _context(product_ndv=None, stock_ndv=None) -> PlanningContext:
+    # Default inputs, with distinct_values on the IDP join key of Product and/or Stock
+    base = default_context()
+    stats = copy.deepcopy(base.statistics)
+    for collection, ndv in (("Product", product_ndv), ("Stock", stock_ndv)):
+        if ndv is not None:
+            stats["collections"][collection]["field_specifics"]["IDP"] = {"distinct_values": ndv}
+    return PlanningContext(stats, base.dataclasses, base.key_sizes, base.cost_model)
+
+
+def _join(operator, ctx, selectivity=None):
+    return operator("Stock", "Product", "IDP", ["name", "quantity"], selectivity, context=ctx).run()
+
+
+def test_estimate_join_cardinality():
+    with_ndv = {"field_specifics": {"IDP": {"distinct_values": 1000}}}
+    without_ndv = {"field_specifics": {}}
+    assert estimate_join_cardinality(20000, 100, with_ndv, with_ndv, "IDP") == 2000
+    assert estimate_join_cardinality(20000, 100, with_ndv, without_ndv, "IDP") == 2000
+    assert estimate_join_cardinality(20000, 100, without_ndv, with_ndv, "IDP") == 2000
+    assert estimate_join_cardinality(20000, 100, without_ndv, without_ndv, "IDP") is None
+
+
+def test_join_ndv_both_sides():
+    # n_left * n_right / max(ndv_left, ndv_right)
+    ctx = _context(product_ndv=100000, stock_ndv=50000)
+    for operator in JOIN_OPERATORS:
+        assert _join(operator, ctx)["output_doc_count"] == 20000000 * 100000 // 100000
+
+
+def test_join_ndv_one_side():
+    ctx = _context(product_ndv=100000)
+    for operator in JOIN_OPERATORS:
+        assert _join(operator, ctx)["output_doc_count"] == 20000000 * 100000 // 100000
+
+
+def test_join_without_ndv_uses_default_selectivity():
+    ctx = _context()
+    for operator in JOIN_OPERATORS:
+        assert _join(operator, ctx)["output_doc_count"] == int(20000000 * 100000 * 0.001)
+
+
+def test_join_explicit_selectivity_overrides_ndv():
+    ctx = _context(product_ndv=100000, stock_ndv=100000)
+    for operator in JOIN_OPERATORS:
+        assert _join(operator, ctx, 0.02)["output_doc_count"] == int(20000000 * 100000 * 0.02)
+
+
+if __name__ == "__main__":
+    test_estimate_join_cardinality()
+    test_join_ndv_both_sides()
+    test_join_ndv_one_side()
+    test_join_without_ndv_uses_default_selectivity()
+    test_join_explicit_selectivity_overrides_ndv()
+    print("Join cardinality checks passed")
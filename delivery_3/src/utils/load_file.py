@@ -1,8 +1,32 @@
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from typing import Callable
 from venv import logger
 from pathlib import Path
-import json
+
+# Prefer a C-accelerated parser when one is installed, stdlib json otherwise
+try:
+    import orjson as json_parser
+except ImportError:
+    try:
+        import ujson as json_parser
+    except ImportError:
+        import json as json_parser
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path_str: str, mtime_ns: int):
+    # Parse a file once per (path, modification time), shared by every reader
+    with open(path_str, "rb") as f:
+        return json_parser.loads(f.read())
+
+
+def load_json(path: Path):
+    """ Parsed content of a json input file, cached until the file changes """
+    if not path.exists():
+        raise FileNotFoundError(f"Missing file: {path}")
+    return _load_json_cached(str(path.resolve()), path.stat().st_mtime_ns)
+
 
 class FileLoaderBase(metaclass=ABCMeta):
     """ Base class for a loader """
@@ -48,9 +72,8 @@ class JsonFileLoader(FileLoaderBase):
         try:
             if not self._check(file_path):
                 raise Exception("The file does not exist.")
-            with open(file_path, 'r') as f:
-                file = json.load(f)
-            return file
+            # Same parse cache as load_json, the result is shared with other readers
+            return _load_json_cached(str(file_path.resolve()), file_path.stat().st_mtime_ns)
         except Exception as e:
             logger.error(e)
         
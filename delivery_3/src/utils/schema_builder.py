@@ -4,11 +4,33 @@ from typing import Dict, Any, Optional, List, Union
 from dataclasses import make_dataclass, field
 from enum import Enum
 
+
+# JSON schema formats and primitive types with a direct Python equivalent
+_FORMAT_MAP = {"date": str, "date-time": str, "email": str, "uri": str, "uuid": str}
+_PRIMITIVE_MAP = {"integer": int, "number": float, "boolean": bool, "null": type(None)}
+
+# Shared read-only defaults for objects without properties / required fields
+_EMPTY = {}
+_NO_REQUIRED = ()
+
+
+# Type of free-form objects (no declared properties)
+_DICT_STR_ANY = Dict[str, Any]
+
 class SchemaBuilder:
     """Build Pythopn object from json schema"""
     
     def __init__(self, schema: Dict[str, Any]):
         self.schema: Dict[str, Any] = schema
+        # Collection definitions, looked up for every collection and $ref
+        self._properties: Dict[str, Any] = schema.get("properties") or _EMPTY
+        # One dataclass per collection / nested object, shared by every reference
+        self._class_cache: Dict[str, type] = {}
+        # One Enum per (name, values), whatever field declares it
+        self._enum_cache: Dict[tuple, type] = {}
+        # Optional[T] / List[T] aliases per type, kept with the builder that generated the types
+        self._optional_cache: Dict[Any, Any] = {}
+        self._list_cache: Dict[Any, Any] = {}
     
     def create_dataclass_from_collection(self, collection_name: str):
         """
@@ -21,35 +43,19 @@ class SchemaBuilder:
             a data class corresponding to the collection
         """
         
-        collection_def = self.schema.get("properties", {}).get(collection_name)
+        if collection_name in self._class_cache:
+            return self._class_cache[collection_name]
+        
+        collection_def = self._properties.get(collection_name)
         if not collection_def:
             raise ValueError(f"Collection '{collection_name}' not found in schema")
         
-        properties = collection_def.get("properties", {})
-        required_fields = set(collection_def.get("required", []))
-        
-        required_fields_list = []
-        optional_fields_list = []
-        
-        for field_name, field_def in properties.items():
-            field_type = self._get_python_type(field_def, field_name)
-            is_required = field_name in required_fields
-            
-            # Extract format for metadata
-            json_format = field_def.get("format")
-            metadata = {"format": json_format} if json_format else {}
-            
-            if not is_required:
-                field_type = Optional[field_type]
-                # Use field() to attach metadata and default value
-                optional_fields_list.append((field_name, field_type, field(default=None, metadata=metadata)))
-            else:
-                # Use field() to attach metadata (default is MISSING)
-                required_fields_list.append((field_name, field_type, field(metadata=metadata)))
-        
-        fields_list = required_fields_list + optional_fields_list
-        
-        new_class = make_dataclass(collection_name, fields_list)
+        properties = collection_def.get("properties") or _EMPTY
+        required_fields = frozenset(collection_def.get("required") or _NO_REQUIRED)
+        fields_list = self._build_fields(properties, required_fields)
+        
+        new_class = make_dataclass(collection_name, fields_list, slots=True)
+        self._class_cache[collection_name] = new_class
         return new_class
     
     def _get_python_type(self, field_def: Dict[str, Any], field_name: str = ""):
@@ -61,42 +67,45 @@ class SchemaBuilder:
         json_format = field_def.get("format")
         
         # Case 1: simple cases like date, email ...
-        if json_format in ["date", "date-time"]:
-            return str
-        elif json_format in ["email", "uri", "uuid"]:
-            return str
+        format_type = _FORMAT_MAP.get(json_format)
+        if format_type is not None:
+            return format_type
         
         # Case 2: primitives
-        if json_type == "integer":
-            return int
-        elif json_type == "number":
-            return float
-        elif json_type == "string":
+        if isinstance(json_type, str):
+            primitive_type = _PRIMITIVE_MAP.get(json_type)
+            if primitive_type is not None:
+                return primitive_type
+        
+        if json_type == "string":
             if "enum" in field_def:
                 enum_values = field_def["enum"]
                 enum_name = f"{field_name.capitalize()}Enum" if field_name else "ValueEnum"
-                return Enum(enum_name, {val: val for val in enum_values})
+                enum_key = (enum_name, tuple(enum_values))
+                if enum_key not in self._enum_cache:
+                    self._enum_cache[enum_key] = Enum(enum_name, {val: val for val in enum_values})
+                return self._enum_cache[enum_key]
             return str
-        elif json_type == "boolean":
-            return bool
-        elif json_type == "null":
-            return type(None)
         
         # Case 3: Array
         elif json_type == "array":
             items_def = field_def.get("items", {})
             item_type = self._get_python_type(items_def)
-            return List[item_type]
+            return self._list_of(item_type)
         
         # Case 4: Object
         elif json_type == "object":
             if "properties" in field_def:
                 nested_class_name = f"{field_name.capitalize()}Object" if field_name else "NestedObject"
                 return self._create_nested_class(nested_class_name, field_def)
-            return Dict[str, Any]
+            return _DICT_STR_ANY
         
         # Case 6: Type multiple (ex: ["string", "null"])
         elif isinstance(json_type, list):
+            # Nullable type, the most common case: Optional[T] from the cache
+            if len(json_type) == 2 and "null" in json_type:
+                other = json_type[1] if json_type[0] == "null" else json_type[0]
+                return self._optional(self._get_python_type({"type": other}))
             types = [self._get_python_type({"type": t}) for t in json_type]
             return Union[tuple(types)]
         
@@ -109,32 +118,55 @@ class SchemaBuilder:
             return Any
         return Any
     
+    def _optional(self, field_type):
+        """Optional[T] alias built once per type, optional fields reuse it"""
+        alias = self._optional_cache.get(field_type)
+        if alias is None:
+            alias = self._optional_cache[field_type] = Optional[field_type]
+        return alias
+    
+    def _list_of(self, item_type):
+        """List[T] alias built once per item type"""
+        alias = self._list_cache.get(item_type)
+        if alias is None:
+            alias = self._list_cache[item_type] = List[item_type]
+        return alias
+    
+    def _field_spec(self, field_name: str, field_def: Dict[str, Any], is_required: bool):
+        """(name, type, field) tuple of one property, with its format as metadata"""
+        field_type = self._get_python_type(field_def, field_name)
+        json_format = field_def.get("format")
+        metadata = {"format": json_format} if json_format else {}
+        if is_required:
+            # Use field() to attach metadata (default is MISSING)
+            return (field_name, field_type, field(metadata=metadata))
+        # Use field() to attach metadata and default value
+        return (field_name, self._optional(field_type), field(default=None, metadata=metadata))
+    
+    def _build_fields(self, properties: Dict[str, Any], required_fields: frozenset) -> list:
+        """Field tuples for make_dataclass, required fields before the optional ones"""
+        return [
+            self._field_spec(name, field_def, True)
+            for name, field_def in properties.items() if name in required_fields
+        ] + [
+            self._field_spec(name, field_def, False)
+            for name, field_def in properties.items() if name not in required_fields
+        ]
+    
     def _create_nested_class(self, class_name: str, object_def: Dict[str, Any]):
         """Build nested classes for "object into object" """
         
-        properties = object_def.get("properties", {})
-        required_fields = set(object_def.get("required", []))
+        # Structurally identical nested objects share the same dataclass
+        cache_key = json.dumps(object_def, sort_keys=True)
+        if cache_key in self._class_cache:
+            return self._class_cache[cache_key]
         
-        required_fields_list = []
-        optional_fields_list = []
-
-        for field_name, field_def in properties.items():
-            field_type = self._get_python_type(field_def, field_name)
-            is_required = field_name in required_fields
-            
-            # Extract format for metadata
-            json_format = field_def.get("format")
-            metadata = {"format": json_format} if json_format else {}
-            
-            if not is_required:
-                field_type = Optional[field_type]
-                optional_fields_list.append((field_name, field_type, field(default=None, metadata=metadata)))
-            else:
-                required_fields_list.append((field_name, field_type, field(metadata=metadata)))
-
-        fields_list = required_fields_list + optional_fields_list
+        properties = object_def.get("properties") or _EMPTY
+        required_fields = frozenset(object_def.get("required") or _NO_REQUIRED)
+        fields_list = self._build_fields(properties, required_fields)
         
-        new_class = make_dataclass(class_name, fields_list)
+        new_class = make_dataclass(class_name, fields_list, slots=True)
+        self._class_cache[cache_key] = new_class
         return new_class
     
     def create_all_dataclasses(self) -> Dict[str, type]:
@@ -145,12 +177,13 @@ class SchemaBuilder:
             Dict {collection name: dataclass}
         """
         
-        dataclasses = {}
-        
-        for collection_name in self.schema.get("properties", {}).keys():
-            dataclasses[collection_name] = self.create_dataclass_from_collection(collection_name)
-        
-        return dataclasses
+        # Collections already built are taken from the cache directly, the
+        # returned dict is a fresh one (the cache also holds nested classes)
+        cache = self._class_cache
+        return {
+            collection_name: cache.get(collection_name) or self.create_dataclass_from_collection(collection_name)
+            for collection_name in self._properties
+        }
     
     def get_schema_info(self) -> Dict[str, Any]:
         """Print details ion the schema"""
@@ -158,6 +191,6 @@ class SchemaBuilder:
         return {
             "title": self.schema.get("title", "Unknown"),
             "schema_version": self.schema.get("$schema", "Unknown"),
-            "collections": list(self.schema.get("properties", {}).keys()),
-            "total_collections": len(self.schema.get("properties", {}))
+            "collections": list(self._properties.keys()),
+            "total_collections": len(self._properties)
         }
\ No newline at end of file
@@ -210,7 +210,36 @@ class SizeComputer:
             "total_size_mb": total_size_bytes / (1000 * 1000),
             "total_size_gb": total_size_bytes / (1000 * 1000 * 1000)
         }
-    
+
+    @staticmethod
+    def build_field_size_table(
+        collections: Dict[str, type],
+        key_sizes: Dict[str, int],
+        statistics: Dict[str, Any]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Compute the size of every top-level field of every collection
+
+        Args:
+            collections: Dictionary of {collection_name: dataclass_type}
+            key_sizes: Dictionary of base type sizes
+            statistics: Statistics dictionary from JSON file
+
+        Returns:
+            Dictionary of {collection_name: {field_name: size in bytes}}
+        """
+        collections_stats = statistics.get("collections", {})
+
+        table = {}
+        for col_name, dataclass_type in collections.items():
+            field_specs = collections_stats.get(col_name, {}).get("field_specifics", {})
+            table[col_name] = {
+                name: SizeComputer.compute_field_size(f.type, name, key_sizes, field_specs.get(name, {}))
+                for name, f in dataclass_type.__dataclass_fields__.items()
+            }
+
+        return table
+
     @staticmethod
     def compute_database_size(
         collections: Dict[str, type],
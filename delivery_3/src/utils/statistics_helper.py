@@ -0,0 +1,32 @@
+# Helpers reading the per-collection statistics (basic_statistic.json format)
+
+
+def estimate_join_cardinality(n_left: int, n_right: int, left_stats: dict, right_stats: dict, join_key: str):
+    # Equijoin output n_left * n_right / max(ndv_left, ndv_right) from the join key's distinct_values,
+    # None when neither side has distinct_values statistics
+    ndv_left = left_stats.get("field_specifics", {}).get(join_key, {}).get("distinct_values")
+    ndv_right = right_stats.get("field_specifics", {}).get(join_key, {}).get("distinct_values")
+    if ndv_left is None and ndv_right is None:
+        return None
+    return (n_left * n_right) // max(int(ndv_left or 0), int(ndv_right or 0), 1)
+
+
+def field_columns(col_stats: dict) -> dict:
+    # field_specifics of one collection as columns, None where a field lacks a statistic
+    specifics = col_stats.get("field_specifics", {})
+    return {
+        "index": {name: i for i, name in enumerate(specifics)},
+        "avg_length": [field_stats.get("avg_length") for field_stats in specifics.values()],
+        "distinct_values": [field_stats.get("distinct_values") for field_stats in specifics.values()],
+    }
+
+
+def column_lookup(columns: dict, stat: str, keys, default) -> list:
+    # One statistic for each of the given fields, default where it is missing
+    index, values = columns["index"], columns[stat]
+    out = []
+    for key in keys:
+        i = index.get(key)
+        value = values[i] if i is not None else None
+        out.append(default if value is None else value)
+    return out